@@ -6,12 +6,13 @@ Wrapper script for the EmojiChecker hook.
 This maintains backward compatibility while using the new namespaced module structure.
 """
 
+import os
 import sys
-from pathlib import Path
 
-# Add the hooks directory to the Python path
-hooks_dir = Path(__file__).parent
-sys.path.insert(0, str(hooks_dir))
+# Add the hooks directory to the Python path (os.path avoids importing pathlib at startup)
+hooks_dir = os.path.dirname(os.path.abspath(__file__))
+if hooks_dir not in sys.path:
+    sys.path.insert(0, hooks_dir)
 
 from claude_code_hooks.emoji_checker import main
 
@@ -11,8 +11,25 @@ Allows monochrome Unicode symbols like ✓ × → • but blocks colorful emojis
 import json
 import re
 import sys
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    # Optional C JSON parser/serializer; falls back to the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _merge_ranges(ranges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort inclusive (lo, hi) code point ranges and merge overlapping or adjacent ones."""
+    ranges = sorted(ranges)
+    merged = [ranges[0]]
+    for lo, hi in ranges[1:]:
+        if lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
 
 
 class EmojiChecker:
@@ -24,7 +41,7 @@ class EmojiChecker:
     """
 
     # Colorful symbols that should be blocked
-    COLORFUL_SYMBOLS = {
+    COLORFUL_SYMBOLS: ClassVar[Set[str]] = {
         "\u2705",  # ✅ green checkmark
         "\u274c",  # ❌ red X
         "\u2b50",  # ⭐ star
@@ -41,89 +58,113 @@ class EmojiChecker:
         "\u2797",  # ➗ division sign
     }
 
-    # Regex pattern for colorful emoji ranges
-    COLORFUL_EMOJI_PATTERN = re.compile(
-        "["
-        "\U0001f600-\U0001f64f"  # emoticons (😀😃😄😊😢😭)
-        "\U0001f680-\U0001f6ff"  # transport & map symbols (🚀🚂🚗✈️🏠)
-        "\U0001f300-\U0001f5ff"  # miscellaneous symbols (🌟🎉📱💻🎈)
-        "\U0001f900-\U0001f9ff"  # supplemental symbols (🤔🦄🧠🤖)
-        "\U0001f1e0-\U0001f1ff"  # regional indicators/flags (🇺🇸🇬🇧)
-        "]+",
-        flags=re.UNICODE,
+    # Colorful emoji ranges as inclusive (lo, hi) code point pairs
+    COLORFUL_RANGES: ClassVar[Tuple[Tuple[int, int], ...]] = (
+        (0x1F600, 0x1F64F),  # emoticons (😀😃😄😊😢😭)
+        (0x1F680, 0x1F6FF),  # transport & map symbols (🚀🚂🚗✈️🏠)
+        (0x1F300, 0x1F5FF),  # miscellaneous symbols (🌟🎉📱💻🎈)
+        (0x1F900, 0x1F9FF),  # supplemental symbols (🤔🦄🧠🤖)
+        (0x1F1E0, 0x1F1FF),  # regional indicators/flags (🇺🇸🇬🇧)
     )
 
-    # File extensions to check
-    MONITORED_EXTENSIONS = {".py", ".md", ".mdx"}
+    # File type reported for each monitored (lowercase) extension
+    FILE_TYPES: ClassVar[Dict[str, str]] = {
+        ".py": "Python",
+        ".md": "Markdown",
+        ".mdx": "Markdown",
+    }
 
-    @classmethod
-    def has_emojis(cls, text: str) -> bool:
-        """Check if text contains colorful emoji characters (allows monochrome symbols)."""
-        if not text:
-            return False
+    # File extensions to check; kept as a public alias of FILE_TYPES' keys for callers,
+    # while get_file_type() classifies through FILE_TYPES itself
+    MONITORED_EXTENSIONS: ClassVar[Set[str]] = set(FILE_TYPES)
 
-        # Check for specific colorful symbols first
-        for char in text:
-            if char in cls.COLORFUL_SYMBOLS:
-                return True
+    # Tools whose input is checked; anything else is allowed before touching its input
+    MONITORED_TOOLS: ClassVar[FrozenSet[str]] = frozenset({"Write", "Edit", "MultiEdit"})
 
-        # Check for colorful emoji ranges
-        return bool(cls.COLORFUL_EMOJI_PATTERN.search(text))
+    # Input field holding the content of single-content tools (MultiEdit has a list of edits)
+    _CONTENT_FIELDS: ClassVar[Dict[str, str]] = {
+        "Write": "content",
+        "Edit": "new_string",
+    }
+
+    # Static advice appended to every deny reason
+    _DENY_SUFFIX: ClassVar[str] = (
+        "\n\nPython and Markdown files should not contain colorful emojis for professional"
+        " code standards. Simple symbols like ✓ × → • are allowed. Please remove the"
+        " colorful emojis and try again."
+    )
 
     @classmethod
-    def get_emoji_examples(cls, text: str, max_examples: int = 3) -> List[str]:
-        """Extract colorful emoji examples from text for error reporting."""
-        emojis = []
+    def scan(cls, text: str, max_examples: int = 3) -> List[str]:
+        """
+        Collect up to max_examples unique colorful emojis from text in a single pass.
 
-        # Check for specific colorful symbols first
-        for char in text:
-            if char in cls.COLORFUL_SYMBOLS and char not in emojis:
+        Returns an empty list if the text is clean.
+        """
+        emojis: List[str] = []
+        # Pure ASCII text (most source files) cannot contain emojis
+        if not text or max_examples < 1 or text.isascii():
+            return emojis
+
+        # The regex engine sweeps the string buffer in C and only surfaces blocked characters
+        for match in _EMOJI_PATTERN.finditer(text):
+            char = match.group()
+            if char not in emojis:
                 emojis.append(char)
-                if len(emojis) >= max_examples:
-                    return emojis
-
-        # Check for colorful emoji ranges
-        if len(emojis) < max_examples:
-            for match in cls.COLORFUL_EMOJI_PATTERN.finditer(text):
-                for char in match.group():
-                    if char not in emojis:
-                        emojis.append(char)
-                        if len(emojis) >= max_examples:
-                            break
+                # Stop at the last example needed instead of finishing the text
                 if len(emojis) >= max_examples:
                     break
 
         return emojis
 
     @classmethod
-    def is_monitored_file(cls, file_path: str) -> bool:
-        """Check if the file should be monitored for emojis."""
+    def has_emojis(cls, text: str) -> bool:
+        """Check if text contains colorful emoji characters (allows monochrome symbols)."""
+        # A yes/no answer only needs the first hit, so search() stops there
+        return bool(text) and not text.isascii() and _EMOJI_PATTERN.search(text) is not None
+
+    @classmethod
+    def get_emoji_examples(cls, text: str, max_examples: int = 3) -> List[str]:
+        """Extract colorful emoji examples from text for error reporting."""
+        return cls.scan(text, max_examples)
+
+    @classmethod
+    def get_file_type(cls, file_path: str) -> Optional[str]:
+        """Return "Python" or "Markdown" for monitored files, or None otherwise."""
         if not file_path:
-            return False
+            return None
 
-        path = Path(file_path)
-        return path.suffix.lower() in cls.MONITORED_EXTENSIONS
+        # A single dict lookup on the final extension classifies the file. Like
+        # Path.suffix, a dotfile such as ".py" or "dir/.md" has no extension
+        stem, dot, extension = file_path.rpartition(".")
+        if not dot or not stem or stem.endswith(("/", "\\")):
+            return None
+        return cls.FILE_TYPES.get(dot + extension.lower())
 
     @classmethod
-    def extract_content_from_tool_input(cls, tool_name: str, tool_input: Dict[str, Any]) -> str:
-        """Extract content to check from different tool types."""
-        content = ""
+    def is_monitored_file(cls, file_path: str) -> bool:
+        """Check if the file should be monitored for emojis."""
+        return cls.get_file_type(file_path) is not None
 
-        if tool_name == "Write":
-            content = tool_input.get("content", "")
-        elif tool_name == "Edit":
-            content = tool_input.get("new_string", "")
+    @classmethod
+    def _iter_contents(cls, tool_name: str, tool_input: Dict[str, Any]) -> Iterator[str]:
+        """Yield each non-empty piece of content to check for the given tool."""
+        field = cls._CONTENT_FIELDS.get(tool_name)
+        pieces: Iterable[str]
+        if field is not None:
+            pieces = (tool_input.get(field, ""),)
         elif tool_name == "MultiEdit":
             # Check all edits
-            edits = tool_input.get("edits", [])
-            content_parts = []
-            for edit in edits:
-                new_string = edit.get("new_string", "")
-                if new_string:
-                    content_parts.append(new_string)
-            content = " ".join(content_parts)
+            pieces = (edit.get("new_string", "") for edit in tool_input.get("edits", ()))
+        else:
+            pieces = ()
+        # Skip empty pieces
+        return filter(None, pieces)
 
-        return content
+    @classmethod
+    def extract_content_from_tool_input(cls, tool_name: str, tool_input: Dict[str, Any]) -> str:
+        """Extract content to check from different tool types."""
+        return " ".join(cls._iter_contents(tool_name, tool_input))
 
     @classmethod
     def process_hook_request(cls, input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -134,52 +175,145 @@ class EmojiChecker:
         if the operation should be blocked.
         """
         tool_name = input_data.get("tool_name", "")
-        tool_input = input_data.get("tool_input", {})
 
         # Only check Write/Edit/MultiEdit operations
-        if tool_name not in ["Write", "Edit", "MultiEdit"]:
+        if tool_name not in cls.MONITORED_TOOLS:
             return None
 
         # Get file path
+        tool_input = input_data.get("tool_input", {})
         file_path = tool_input.get("file_path", "")
 
         # Check if it's a monitored file
-        if not cls.is_monitored_file(file_path):
+        file_type = cls.get_file_type(file_path)
+        if file_type is None:
             return None
 
-        # Extract content to check
-        content = cls.extract_content_from_tool_input(tool_name, tool_input)
-
-        # Check for emojis
-        if cls.has_emojis(content):
-            emoji_examples = cls.get_emoji_examples(content)
-            examples_str = " ".join(emoji_examples) if emoji_examples else "detected"
-            file_type = "Python" if file_path.endswith(".py") else "Markdown"
-
+        # Check for emojis piece by piece, without joining the content first; each
+        # piece is swept once, and scan() is bound to a local rather than looked up per edit
+        scan = cls.scan
+        emoji_examples: List[str] = []
+        for content in cls._iter_contents(tool_name, tool_input):
+            # Always ask for 3 so a piece repeating earlier examples can still add new ones
+            for emoji in scan(content, 3):
+                if emoji not in emoji_examples:
+                    emoji_examples.append(emoji)
+                    if len(emoji_examples) >= 3:
+                        break
+            if len(emoji_examples) >= 3:
+                break
+
+        if emoji_examples:
             return {
                 "hookSpecificOutput": {
                     "hookEventName": "PreToolUse",
                     "permissionDecision": "deny",
-                    "permissionDecisionReason": f"❌ Colorful emojis detected in {file_type} file '{file_path}': {examples_str}\n\nPython and Markdown files should not contain colorful emojis for professional code standards. Simple symbols like ✓ × → • are allowed. Please remove the colorful emojis and try again.",
+                    "permissionDecisionReason": "".join(
+                        (
+                            "❌ Colorful emojis detected in ",
+                            file_type,
+                            " file '",
+                            file_path,
+                            "': ",
+                            " ".join(emoji_examples),
+                            cls._DENY_SUFFIX,
+                        )
+                    ),
                 }
             }
 
         return None
 
 
-def main():
-    """Main hook function for command-line usage."""
+# Character class matching exactly the blocked code points: COLORFUL_SYMBOLS and
+# COLORFUL_RANGES merged into sorted intervals, so the regex engine finds every
+# example in C without a per-character table test in Python
+_EMOJI_PATTERN = re.compile(
+    "["
+    + "".join(
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in _merge_ranges(
+            [(ord(symbol), ord(symbol)) for symbol in EmojiChecker.COLORFUL_SYMBOLS]
+            + list(EmojiChecker.COLORFUL_RANGES)
+        )
+    )
+    + "]"
+)
+
+
+def _write_json(data: Any) -> None:
+    """Write data to stdout as a single line of JSON."""
+    if orjson:
+        try:
+            sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+            return
+        except TypeError:
+            # orjson refuses strings holding lone surrogates; json escapes them
+            pass
+    print(json.dumps(data))
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse raw JSON bytes, raising json.JSONDecodeError if they are invalid."""
+    if orjson:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes (e.g. "\udc80") that json accepts
+            pass
+    return json.loads(raw)
+
+
+def _read_json(raw: bytes) -> Any:
+    """Parse raw JSON bytes, exiting with an error message if they are invalid."""
     try:
-        input_data = json.load(sys.stdin)
+        return _parse_json(raw)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main hook function for command-line usage.
+
+    With --batch, reads a JSON array of hook inputs and writes a JSON array with one
+    result per input (null when the operation is allowed). With --server, reads one
+    JSON input per line and answers each with one line of JSON until stdin is closed;
+    a line that is not a JSON object is answered with {"error": ...} instead of
+    ending the session. argv defaults to sys.argv[1:].
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if "--server" in args:
+        for line in sys.stdin.buffer:
+            if not line.strip():
+                continue
+            try:
+                input_data = _parse_json(line)
+            except json.JSONDecodeError as e:
+                _write_json({"error": f"Invalid JSON input: {e}"})
+            else:
+                if isinstance(input_data, dict):
+                    _write_json(EmojiChecker.process_hook_request(input_data))
+                else:
+                    _write_json({"error": "Hook input must be a JSON object"})
+            sys.stdout.flush()
+        sys.exit(0)
+
+    # Read raw bytes and skip text-mode decoding; both parsers accept bytes.
+    # The buffer is not bound to a name so it is freed before scanning starts.
+    input_data = _read_json(sys.stdin.buffer.read())
+
+    if "--batch" in args:
+        _write_json([EmojiChecker.process_hook_request(item) for item in input_data])
+        sys.exit(0)
+
     # Process the hook request
     result = EmojiChecker.process_hook_request(input_data)
     
     if result:
-        print(json.dumps(result))
+        _write_json(result)
         sys.exit(0)
 
     # Allow the operation if no emojis found
@@ -187,4 +321,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,14 +2,185 @@
 Pytest configuration and shared fixtures.
 """
 
+import importlib.util
+import io
+import json
+import os
 import pytest
+import queue
+import subprocess
 import sys
-from pathlib import Path
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from types import SimpleNamespace
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the hooks directory to Python path for testing
-project_root = Path(__file__).parent.parent
-hooks_dir = project_root / "hooks"
-sys.path.insert(0, str(hooks_dir))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+hooks_dir = os.path.join(project_root, "hooks")
+if hooks_dir not in sys.path:
+    sys.path.insert(0, hooks_dir)
+
+# The hook entry point Claude Code runs, and the backward-compatible shim at the repo root
+hook_script = os.path.join(hooks_dir, "check-no-emojis.py")
+root_hook_script = os.path.join(project_root, "check-no-emojis.py")
+
+# Load the hook entry point once so tests can call it without spawning a subprocess
+_spec = importlib.util.spec_from_file_location("emoji_hook", hook_script)
+emoji_hook = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(emoji_hook)
+
+# Cheapest tests, run first so a broken hook fails fast under -x
+_FAST_TESTS = {
+    "test_edge_case_empty_content",
+    "test_edge_case_whitespace_only",
+    "test_hook_handles_invalid_json",
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Move the cheapest tests to the front, keeping the order of everything else."""
+    items.sort(key=lambda item: item.name not in _FAST_TESTS)
+
+
+def _dumps(obj):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_input(input_data):
+    """Return hook input as bytes; str and bytes are taken as already serialized JSON."""
+    if isinstance(input_data, bytes):
+        return input_data
+    return input_data.encode("utf-8") if isinstance(input_data, str) else _dumps(input_data)
+
+
+def _run_hook_in_process(input_data):
+    """
+    Run the emoji hook in-process on the given input.
+
+    Accepts a dict (serialized to JSON) or a raw str/bytes payload, and returns an object with
+    the same returncode/stdout/stderr attributes as subprocess.run's result.
+    """
+    # The hook reads and writes the underlying byte buffers, so wrap BytesIO objects
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.StringIO()
+    stdin, sys.stdin = sys.stdin, io.TextIOWrapper(io.BytesIO(_encode_input(input_data)), encoding="utf-8")
+    returncode = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            emoji_hook.main([])
+    except SystemExit as e:
+        returncode = e.code or 0
+    finally:
+        sys.stdin = stdin
+    stdout.flush()
+    return SimpleNamespace(
+        returncode=returncode,
+        stdout=stdout.buffer.getvalue().decode("utf-8"),
+        stderr=stderr.getvalue(),
+    )
+
+
+@pytest.fixture(scope="session")
+def hook_runner():
+    """Shared entry point for running the hook once per input, in-process."""
+    return _run_hook_in_process
+
+
+def _run_hook_subprocess(input_data, *args, want_stderr=False, root_shim=False):
+    """
+    Run the emoji hook in a fresh interpreter with the given CLI arguments.
+
+    Input is written as bytes and stdout is returned undecoded. stderr is discarded
+    unless want_stderr is set, so only the streams a test inspects get a pipe.
+    root_shim runs the repo-root check-no-emojis.py instead of the one in hooks/.
+    """
+    return subprocess.run(
+        [sys.executable, root_hook_script if root_shim else hook_script, *args],
+        input=_encode_input(input_data),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
+    )
+
+
+@pytest.fixture(scope="session")
+def hook_subprocess():
+    """Run the hook as a separate process, for behaviour that needs a real CLI."""
+    return _run_hook_subprocess
+
+
+class HookServer:
+    """A long-lived emoji hook process in --server mode, answering one request per line."""
+
+    # Seconds to wait for one reply before treating the hook as hung
+    TIMEOUT = 10
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", hook_script, "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        # Replies are read on a thread so a hung hook times out instead of blocking
+        self._replies = queue.Queue()
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+
+    def _read_replies(self):
+        """Queue each reply line, then b"" once the hook's stdout is closed."""
+        for line in self.process.stdout:
+            self._replies.put(line)
+        self._replies.put(b"")
+
+    def __call__(self, input_data):
+        """
+        Send one hook input and return the decoded result (None when allowed).
+
+        Accepts a dict (serialized to JSON) or already serialized JSON as str or bytes.
+        """
+        try:
+            self.process.stdin.write(_encode_input(input_data) + b"\n")
+            self.process.stdin.flush()
+        except BrokenPipeError:
+            raise RuntimeError(f"hook server exited with code {self.process.wait()}") from None
+        try:
+            reply = self._replies.get(timeout=self.TIMEOUT)
+        except queue.Empty:
+            raise RuntimeError(f"hook server sent no reply within {self.TIMEOUT} seconds") from None
+        if not reply:
+            raise RuntimeError(f"hook server exited with code {self.process.wait()} before replying")
+        return _loads(reply)
+
+    def close(self):
+        """Close stdin so the hook exits, then reap it."""
+        self.process.stdin.close()
+        self.process.wait()
+        self._reader.join()
+        self.process.stdout.close()
+
+
+@pytest.fixture(scope="session")
+def hook_server():
+    """Session-wide hook process shared by every test that talks to a real hook."""
+    server = HookServer()
+    yield server
+    server.close()
 
 
 @pytest.fixture
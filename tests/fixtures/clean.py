@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+A sample Python application without emojis.
+"""
+
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    """Main application entry point."""
+    logger.info("Starting application...")
+
+    # Process data
+    data = process_data()
+
+    if data:
+        logger.info("Processing completed successfully")
+        print("Status: Complete")
+        return True
+    else:
+        logger.error("Processing failed")
+        print("Status: Failed")
+        return False
+
+def process_data():
+    """Process some data and return results."""
+    try:
+        # Simulate data processing
+        result = {"status": "complete", "count": 42}
+        logger.debug(f"Processed data: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"Error processing data: {e}")
+        return None
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+A sample Python application with emojis that should be blocked.
+"""
+
+def main():
+    print("Starting application... 🚀")
+
+    # Process data
+    data = process_data()
+
+    if data:
+        print("Success! ✅")
+        return True
+    else:
+        print("Failed! ❌")
+        return False
+
+def process_data():
+    """Process some data."""
+    # Simulate processing
+    return {"status": "complete", "emoji": "🎉"}
+
+if __name__ == "__main__":
+    main()
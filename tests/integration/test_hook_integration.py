@@ -6,222 +6,314 @@ and integrate properly with the overall hook system.
 """
 
 import json
+import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
+import sysconfig
 import pytest
+from claude_code_hooks import emoji_checker
 
-# Path to the hooks
-HOOKS_DIR = Path(__file__).parent.parent.parent / "hooks"
-EMOJI_HOOK_PATH = HOOKS_DIR / "check-no-emojis.py"
+from tests.conftest import _dumps
+
+# Valid JSON the stdlib parser accepts but orjson rejects: a lone surrogate escape
+LONE_SURROGATE_JSON = r'{"tool_name": "Write", "tool_input": {"file_path": "a\udc80.py", "content": "x 🚀"}}'
+
+# Hook input for each test, keyed by test name without the "test_" prefix
+CASES = {
+    "hook_allows_clean_content": {
+        "tool_name": "Write",
+        "tool_input": {
+            "file_path": "test.py",
+            "content": "def hello():\n    print('Hello World')\n    return True"
+        }
+    },
+    "hook_blocks_emoji_content": {
+        "tool_name": "Write",
+        "tool_input": {
+            "file_path": "test.py",
+            "content": "def hello():\n    print('Hello World! 🚀')\n    return True"
+        }
+    },
+    "hook_allows_monochrome_symbols": {
+        "tool_name": "Write",
+        "tool_input": {
+            "file_path": "test.py",
+            "content": "# Status: ✓ Complete\n# Progress: →\n• Item 1\n• Item 2"
+        }
+    },
+    "hook_ignores_non_python_files": {
+        "tool_name": "Write",
+        "tool_input": {
+            "file_path": "test.txt",
+            "content": "Hello World! 🚀 ✅ ❌"
+        }
+    },
+    "hook_ignores_non_write_operations": {
+        "tool_name": "Read",
+        "tool_input": {
+            "file_path": "test.py"
+        }
+    },
+    "hook_handles_edit_operations": {
+        "tool_name": "Edit",
+        "tool_input": {
+            "file_path": "test.py",
+            "old_string": "old_code",
+            "new_string": "print('New code! 🚀')"
+        }
+    },
+    "hook_handles_multiedit_operations": {
+        "tool_name": "MultiEdit",
+        "tool_input": {
+            "file_path": "test.py",
+            "edits": [
+                {"old_string": "old1", "new_string": "Clean code"},
+                {"old_string": "old2", "new_string": "Code with emoji 🚀"}
+            ]
+        }
+    },
+    "hook_markdown_files": {
+        "tool_name": "Write",
+        "tool_input": {
+            "file_path": "README.md",
+            "content": "# Project Title\n\nThis is awesome! 🚀"
+        }
+    },
+}
+
+# Each case serialized to JSON bytes once at import; the hook runners pass bytes through unchanged
+CASES_JSON = {name: _dumps(case) for name, case in CASES.items()}
 
 
 class TestEmojiHookIntegration:
     """Integration tests for the emoji checker hook."""
 
-    def test_hook_allows_clean_content(self):
+    def test_hook_allows_clean_content(self, hook_runner):
         """Test that hook allows content without emojis."""
-        input_data = {
-            "tool_name": "Write",
-            "tool_input": {
-                "file_path": "test.py",
-                "content": "def hello():\n    print('Hello World')\n    return True"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_allows_clean_content"])
+
         # Should exit with code 0 (allowed)
         assert process.returncode == 0
         assert process.stdout.strip() == ""
 
-    def test_hook_blocks_emoji_content(self):
+    def test_hook_blocks_emoji_content(self, hook_runner):
         """Test that hook blocks content with emojis."""
-        input_data = {
-            "tool_name": "Write",
-            "tool_input": {
-                "file_path": "test.py",
-                "content": "def hello():\n    print('Hello World! 🚀')\n    return True"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
-        # Should exit with code 0 but output hook result
+        process = hook_runner(CASES_JSON["hook_blocks_emoji_content"])
+
+        # Should exit with code 0 but block the operation
         assert process.returncode == 0
-        
+
         # Parse the JSON output
         output = json.loads(process.stdout)
         assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
         assert "🚀" in output["hookSpecificOutput"]["permissionDecisionReason"]
 
-    def test_hook_allows_monochrome_symbols(self):
+    def test_hook_allows_monochrome_symbols(self, hook_runner):
         """Test that hook allows monochrome Unicode symbols."""
-        input_data = {
-            "tool_name": "Write",
-            "tool_input": {
-                "file_path": "test.py",
-                "content": "# Status: ✓ Complete\n# Progress: →\n• Item 1\n• Item 2"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_allows_monochrome_symbols"])
+
         # Should exit with code 0 (allowed)
         assert process.returncode == 0
         assert process.stdout.strip() == ""
 
-    def test_hook_ignores_non_python_files(self):
+    def test_hook_ignores_non_python_files(self, hook_runner):
         """Test that hook ignores non-Python/Markdown files."""
-        input_data = {
-            "tool_name": "Write",
-            "tool_input": {
-                "file_path": "test.txt",
-                "content": "Hello World! 🚀 ✅ ❌"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_ignores_non_python_files"])
+
         # Should exit with code 0 (allowed) since it's a .txt file
         assert process.returncode == 0
         assert process.stdout.strip() == ""
 
-    def test_hook_ignores_non_write_operations(self):
+    def test_hook_ignores_non_write_operations(self, hook_runner):
         """Test that hook ignores operations other than Write/Edit/MultiEdit."""
-        input_data = {
-            "tool_name": "Read",
-            "tool_input": {
-                "file_path": "test.py"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_ignores_non_write_operations"])
+
         # Should exit with code 0 (allowed)
         assert process.returncode == 0
         assert process.stdout.strip() == ""
 
-    def test_hook_handles_edit_operations(self):
+    def test_hook_handles_edit_operations(self, hook_runner):
         """Test hook handling of Edit operations."""
-        input_data = {
-            "tool_name": "Edit",
-            "tool_input": {
-                "file_path": "test.py",
-                "old_string": "old_code",
-                "new_string": "print('New code! 🚀')"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_handles_edit_operations"])
+
         # Should exit with code 0 but block the operation
         assert process.returncode == 0
-        
+
         # Parse the JSON output
         output = json.loads(process.stdout)
         assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
 
-    def test_hook_handles_multiedit_operations(self):
+    def test_hook_handles_multiedit_operations(self, hook_runner):
         """Test hook handling of MultiEdit operations."""
-        input_data = {
-            "tool_name": "MultiEdit",
-            "tool_input": {
-                "file_path": "test.py",
-                "edits": [
-                    {"old_string": "old1", "new_string": "Clean code"},
-                    {"old_string": "old2", "new_string": "Code with emoji 🚀"}
-                ]
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner(CASES_JSON["hook_handles_multiedit_operations"])
+
         # Should exit with code 0 but block the operation
         assert process.returncode == 0
-        
+
         # Parse the JSON output
         output = json.loads(process.stdout)
         assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
 
-    def test_hook_handles_invalid_json(self):
+    def test_hook_handles_invalid_json(self, hook_runner):
         """Test hook handling of invalid JSON input."""
+        stdin, stdout = sys.stdin, sys.stdout
+
         # Run the hook with invalid JSON
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input="invalid json",
-            text=True,
-            capture_output=True
-        )
-        
+        process = hook_runner("invalid json")
+
         # Should exit with code 1 (error)
         assert process.returncode == 1
         assert "Invalid JSON input" in process.stderr
 
-    def test_hook_markdown_files(self):
+        # The error exit must not leak redirected streams into later in-process runs
+        assert sys.stdin is stdin
+        assert sys.stdout is stdout
+
+    def test_hook_handles_lone_surrogates(self, hook_runner):
+        """Test that input with a lone surrogate escape is still checked and answered."""
+        process = hook_runner(LONE_SURROGATE_JSON)
+
+        # Parsing falls back to json, and the deny reason quoting the path is still written
+        assert process.returncode == 0
+        output = json.loads(process.stdout)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+        assert "a\udc80.py" in output["hookSpecificOutput"]["permissionDecisionReason"]
+
+    def test_hook_without_orjson(self, hook_runner, monkeypatch):
+        """Test the stdlib json fallback used when orjson is not installed."""
+        monkeypatch.setattr(emoji_checker, "orjson", None)
+
+        process = hook_runner(CASES_JSON["hook_blocks_emoji_content"])
+        assert process.returncode == 0
+        output = json.loads(process.stdout)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+        process = hook_runner(CASES_JSON["hook_allows_clean_content"])
+        assert process.returncode == 0
+        assert process.stdout.strip() == ""
+
+        process = hook_runner("invalid json")
+        assert process.returncode == 1
+        assert "Invalid JSON input" in process.stderr
+
+    def test_hook_markdown_files(self, hook_runner):
         """Test hook works with Markdown files."""
-        input_data = {
-            "tool_name": "Write",
-            "tool_input": {
-                "file_path": "README.md",
-                "content": "# Project Title\n\nThis is awesome! 🚀"
-            }
-        }
-        
-        # Run the hook as a subprocess
-        process = subprocess.run(
-            [sys.executable, str(EMOJI_HOOK_PATH)],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True
-        )
-        
-        # Should block the operation
+        process = hook_runner(CASES_JSON["hook_markdown_files"])
+
+        # Should exit with code 0 but block the operation
         assert process.returncode == 0
-        
+
         # Parse the JSON output
         output = json.loads(process.stdout)
         assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
-        assert "Markdown" in output["hookSpecificOutput"]["permissionDecisionReason"]
\ No newline at end of file
+        assert "Markdown" in output["hookSpecificOutput"]["permissionDecisionReason"]
+
+    def test_hook_batch_mode(self, hook_subprocess):
+        """Test that --batch returns one result per input from a single hook process."""
+        process = hook_subprocess(b"[" + b",".join(CASES_JSON.values()) + b"]", "--batch")
+
+        assert process.returncode == 0
+        results = dict(zip(CASES, json.loads(process.stdout)))
+        assert results["hook_allows_clean_content"] is None
+        assert results["hook_blocks_emoji_content"]["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_hook_server_mode_survives_bad_lines(self, hook_subprocess):
+        """Test that --server answers malformed lines with an error and keeps serving."""
+        lines = [
+            CASES_JSON["hook_ignores_non_write_operations"],
+            b"not json",
+            b"[1]",
+            CASES_JSON["hook_blocks_emoji_content"],
+        ]
+        process = hook_subprocess(b"\n".join(lines) + b"\n", "--server")
+
+        assert process.returncode == 0
+        results = [json.loads(line) for line in process.stdout.splitlines()]
+        assert len(results) == 4
+        assert results[0] is None
+        assert "Invalid JSON input" in results[1]["error"]
+        assert "error" in results[2]
+        assert results[3]["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_hook_script_default_mode(self, hook_subprocess):
+        """Test the hook script as Claude Code runs it: one request on stdin, no flags."""
+        process = hook_subprocess(CASES_JSON["hook_blocks_emoji_content"])
+        assert process.returncode == 0
+        output = json.loads(process.stdout)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+        assert "🚀" in output["hookSpecificOutput"]["permissionDecisionReason"]
+
+        process = hook_subprocess(CASES_JSON["hook_allows_clean_content"])
+        assert process.returncode == 0
+        assert process.stdout.strip() == b""
+
+        process = hook_subprocess("invalid json", want_stderr=True)
+        assert process.returncode == 1
+        assert b"Invalid JSON input" in process.stderr
+
+    def test_root_shim_default_mode(self, hook_subprocess):
+        """Test the repo-root check-no-emojis.py shim finds and runs the hook."""
+        process = hook_subprocess(CASES_JSON["hook_blocks_emoji_content"], root_shim=True)
+        assert process.returncode == 0
+        output = json.loads(process.stdout)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+        process = hook_subprocess(CASES_JSON["hook_allows_clean_content"], root_shim=True)
+        assert process.returncode == 0
+        assert process.stdout.strip() == b""
+
+
+def _c_compiler():
+    """Return the path of the C compiler extension builds would use, or None."""
+    cc = os.environ.get("CC") or sysconfig.get_config_var("CC") or "cl"
+    return shutil.which(cc.split()[0])
+
+
+# Compiling the extension takes seconds, so the build test only runs when asked for
+@pytest.mark.skipif(
+    os.environ.get("RUN_MYPYC_BUILD") != "1",
+    reason="set RUN_MYPYC_BUILD=1 to build the optional mypyc extension",
+)
+class TestMypycBuild:
+    """Tests for the optional mypyc build, in their own class so xdist gives them a separate worker."""
+
+    def test_mypyc_build_serves_the_hook(self, tmp_path):
+        """Test the documented mypyc build produces the module the hook script imports."""
+        pytest.importorskip("mypyc")
+        if _c_compiler() is None:
+            pytest.skip("no C compiler available to build the mypyc extension")
+        hooks_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "hooks")
+        build_dir = tmp_path / "hooks"
+        shutil.copytree(hooks_dir, build_dir, ignore=shutil.ignore_patterns("__pycache__", "*.so", "build"))
+
+        build = subprocess.run(
+            [sys.executable, "-m", "mypyc", "--explicit-package-bases", "claude_code_hooks/emoji_checker.py"],
+            cwd=build_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        assert build.returncode == 0, build.stderr.decode("utf-8", "replace")
+
+        # The compiled extension, not the .py source, is what the hook package resolves to
+        probe = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import importlib.machinery as m, claude_code_hooks.emoji_checker as e;"
+                " print(e.__file__.endswith(tuple(m.EXTENSION_SUFFIXES)))",
+            ],
+            cwd=build_dir,
+            stdout=subprocess.PIPE,
+        )
+        assert probe.stdout.strip() == b"True"
+
+        process = subprocess.run(
+            [sys.executable, str(build_dir / "check-no-emojis.py")],
+            input=CASES_JSON["hook_blocks_emoji_content"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert process.returncode == 0, process.stderr.decode("utf-8", "replace")
+        output = json.loads(process.stdout)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
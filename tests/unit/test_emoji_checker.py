@@ -37,6 +37,33 @@ class TestEmojiDetection:
         for text in test_cases:
             assert not EmojiChecker.has_emojis(text), f"Should allow symbol in: {text}"
 
+    def test_has_emojis_range_boundaries(self):
+        """Test the first and last code points of each emoji range."""
+        for lo, hi in [(0x1F1E0, 0x1F1FF), (0x1F300, 0x1F5FF), (0x1F600, 0x1F64F),
+                       (0x1F680, 0x1F6FF), (0x1F900, 0x1F9FF)]:
+            assert EmojiChecker.has_emojis(chr(lo))
+            assert EmojiChecker.has_emojis(chr(hi))
+        assert not EmojiChecker.has_emojis(chr(0x1F1DF))
+        assert not EmojiChecker.has_emojis(chr(0x1F650))
+        assert not EmojiChecker.has_emojis(chr(0x1FA00))
+
+    def test_has_emojis_dingbats_block(self):
+        """Test that only the listed U+27xx symbols are blocked."""
+        for cp in range(0x2700, 0x2800):
+            char = chr(cp)
+            assert EmojiChecker.has_emojis(char) == (char in EmojiChecker.COLORFUL_SYMBOLS)
+
+    def test_has_emojis_wide_strings_without_emojis(self):
+        """Test UCS2 and UCS4 strings that are not ASCII but contain no emojis."""
+        assert not EmojiChecker.has_emojis("数据处理 ✓ 完成 " * 100)
+        assert not EmojiChecker.has_emojis("Math 𝒳 + 𝒴 " * 100)
+        assert EmojiChecker.has_emojis("数据处理 " * 100 + "🚀")
+
+    def test_has_emojis_non_ascii_text(self):
+        """Test has_emojis on non-ASCII text with and without blocked characters."""
+        assert not EmojiChecker.has_emojis("数据处理 ✓ 完成")
+        assert EmojiChecker.has_emojis("Launch 🚀")
+
     def test_has_emojis_with_empty_string(self):
         """Test with empty string."""
         assert not EmojiChecker.has_emojis("")
@@ -68,6 +95,21 @@ class TestEmojiDetection:
         examples = EmojiChecker.get_emoji_examples(text, max_examples=3)
         assert len(examples) == 3
 
+    def test_scan_unique_examples_in_order(self):
+        """Test scan returns unique emojis in the order they appear."""
+        text = "🚀 ok ✅ 🚀 done ❌"
+        assert EmojiChecker.scan(text) == ["🚀", "✅", "❌"]
+        assert EmojiChecker.scan(text, max_examples=1) == ["🚀"]
+
+    def test_scan_zero_max_examples(self):
+        """Test scan collects nothing when no examples are requested."""
+        assert EmojiChecker.scan("Hello 🚀", max_examples=0) == []
+
+    def test_scan_clean_text(self):
+        """Test scan returns an empty list for clean text."""
+        assert EmojiChecker.scan("Check ✓ → •") == []
+        assert EmojiChecker.scan("") == []
+
 
 class TestFileMonitoring:
     """Test file monitoring functionality."""
@@ -100,6 +142,30 @@ class TestFileMonitoring:
         assert EmojiChecker.is_monitored_file("file.MD")
         assert EmojiChecker.is_monitored_file("file.MDX")
 
+    def test_get_file_type(self):
+        """Test file type classification of monitored files."""
+        assert EmojiChecker.get_file_type("app.py") == "Python"
+        assert EmojiChecker.get_file_type("APP.PY") == "Python"
+        assert EmojiChecker.get_file_type("README.md") == "Markdown"
+        assert EmojiChecker.get_file_type("page.mdx") == "Markdown"
+        assert EmojiChecker.get_file_type("notes.txt") is None
+        assert EmojiChecker.get_file_type("Makefile") is None
+        assert EmojiChecker.get_file_type("src.py/notes") is None
+        assert EmojiChecker.get_file_type("") is None
+
+    def test_monitored_extensions_alias(self):
+        """Test that MONITORED_EXTENSIONS lists the extensions FILE_TYPES classifies."""
+        assert EmojiChecker.MONITORED_EXTENSIONS == {".py", ".md", ".mdx"}
+        assert EmojiChecker.MONITORED_EXTENSIONS == set(EmojiChecker.FILE_TYPES)
+
+    def test_get_file_type_dotfiles(self):
+        """Test that dotfiles named like an extension are not monitored, as with Path.suffix."""
+        assert EmojiChecker.get_file_type(".py") is None
+        assert EmojiChecker.get_file_type("/x/.md") is None
+        assert EmojiChecker.get_file_type("dir/.mdx") is None
+        assert EmojiChecker.get_file_type("dir/a.py") == "Python"
+        assert EmojiChecker.get_file_type("dir/..py") == "Python"
+
 
 class TestContentExtraction:
     """Test content extraction from tool inputs."""
@@ -238,4 +304,47 @@ class TestHookProcessing:
         }
         result = EmojiChecker.process_hook_request(input_data)
         assert result is not None
-        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
\ No newline at end of file
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_process_hook_request_multiedit_examples_across_edits(self):
+        """Test MultiEdit reports unique examples collected across edits."""
+        input_data = {
+            "tool_name": "MultiEdit",
+            "tool_input": {
+                "file_path": "test.py",
+                "edits": [
+                    {"new_string": "Launch 🚀"},
+                    {"new_string": "Launch 🚀"},
+                    {"new_string": "Done ✅ ❌ 🎉"}
+                ]
+            }
+        }
+        result = EmojiChecker.process_hook_request(input_data)
+        assert result is not None
+        reason = result["hookSpecificOutput"]["permissionDecisionReason"]
+        assert ": 🚀 ✅ ❌\n" in reason
+        assert "🎉" not in reason
+
+    def test_process_hook_request_multiedit_repeated_then_new_emoji(self):
+        """Test a later edit repeating an example can still contribute new ones."""
+        input_data = {
+            "tool_name": "MultiEdit",
+            "tool_input": {
+                "file_path": "test.py",
+                "edits": [
+                    {"new_string": "🚀✅"},
+                    {"new_string": "🚀 ❌"}
+                ]
+            }
+        }
+        result = EmojiChecker.process_hook_request(input_data)
+        assert result is not None
+        assert ": 🚀 ✅ ❌\n" in result["hookSpecificOutput"]["permissionDecisionReason"]
+
+    def test_process_hook_request_allows_clean_non_ascii_content(self):
+        """Test that non-ASCII content without blocked characters is allowed."""
+        input_data = {
+            "tool_name": "Write",
+            "tool_input": {"file_path": "test.py", "content": "Status: • done → 日本語"}
+        }
+        assert EmojiChecker.process_hook_request(input_data) is None